@@ -0,0 +1,42 @@
+import io
+import logging
+import time
+from scriptorium.logger import JSONFormatter
+
+ITERATIONS = 20000
+
+def _fail(message: str = "dependency unavailable"):
+    raise ConnectionError(message)
+
+def run(name: str, formatter: logging.Formatter, varying: bool = False) -> None:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.ERROR)
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    try:
+        start = time.perf_counter()
+        for i in range(ITERATIONS):
+            try:
+                _fail(f"attempt {i}" if varying else "dependency unavailable")
+            except ConnectionError:
+                logger.exception("Retry failed")
+        elapsed = time.perf_counter() - start
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    print(f"{name:<28} {ITERATIONS / elapsed:>12,.0f} records/s")
+
+class UncachedJSONFormatter(JSONFormatter):
+    def _format_cached_exception(self, exc_info):
+        return self.formatException(exc_info)
+
+if __name__ == "__main__":
+    run("uncached", UncachedJSONFormatter())
+    run("cached", JSONFormatter())
+    run("cached + dedupe (60s)", JSONFormatter(exception_dedupe_window=60.0))
+    run("uncached, varying msg", UncachedJSONFormatter(), varying=True)
+    run("cached, varying msg", JSONFormatter(), varying=True)
+    run("dedupe (60s), varying msg", JSONFormatter(exception_dedupe_window=60.0),
+        varying=True)
@@ -4,7 +4,11 @@ import queue
 import threading
 import contextlib
 import time
-from typing import Optional, Dict, Any, Generator
+import hashlib
+import functools
+import builtins
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Generator, Tuple
 from logging.handlers import QueueHandler, QueueListener
 from rich.logging import RichHandler
 from .handlers import CompressedRotatingFileHandler, CompressedTimedRotatingFileHandler
@@ -82,7 +86,113 @@ class ContextFilter(logging.Filter):
             setattr(record, key, value)
         return True
 
+_BaseExceptionGroup = getattr(builtins, "BaseExceptionGroup", None)
+
+def _safe_str(value: Any) -> Optional[str]:
+    try:
+        return str(value)
+    except Exception:
+        return None
+
+def _describe_exception(exc_type: Any, exc: Optional[BaseException], tb: Any,
+                        with_text: bool, seen: set) -> Tuple:
+    chain = []
+    link = None
+    while exc_type is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        frames = []
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            frame = (code.co_filename, code.co_name, code.co_firstlineno,
+                     tb.tb_lineno)
+            if with_text:
+                # The instruction offset decides where 3.11+ draws its carets.
+                frame += (tb.tb_lasti,)
+            frames.append(frame)
+            tb = tb.tb_next
+        entry: list = [link, exc_type.__module__, exc_type.__qualname__,
+                       tuple(frames)]
+        if exc is None:
+            chain.append(tuple(entry))
+            break
+        if with_text:
+            # Messages and notes are rendered into the traceback text but
+            # deliberately left out of the fingerprint.
+            notes = getattr(exc, "__notes__", None)
+            if isinstance(notes, (list, tuple)):
+                notes = tuple(_safe_str(note) for note in notes)
+            elif notes is not None:
+                notes = _safe_str(notes)
+            entry.extend([_safe_str(exc), notes])
+        if _BaseExceptionGroup is not None and isinstance(exc, _BaseExceptionGroup):
+            entry.append(tuple(
+                _describe_exception(type(sub), sub, sub.__traceback__,
+                                    with_text, seen)
+                for sub in exc.exceptions
+            ))
+        chain.append(tuple(entry))
+        if exc.__cause__ is not None:
+            exc = exc.__cause__
+            link = "cause"
+        elif exc.__context__ is not None and not exc.__suppress_context__:
+            exc = exc.__context__
+            link = "context"
+        else:
+            break
+        exc_type = type(exc)
+        tb = exc.__traceback__
+    return tuple(chain)
+
+def exception_fingerprint(exc_info: Tuple) -> Tuple:
+    return _describe_exception(exc_info[0], exc_info[1], exc_info[2], False, set())
+
+@functools.lru_cache(maxsize=1024)
+def _fingerprint_digest(fingerprint: Tuple) -> str:
+    return hashlib.sha1(repr(fingerprint).encode("utf-8")).hexdigest()[:12]
+
+def _exception_fingerprint_id(exc_info: Tuple) -> str:
+    return _fingerprint_digest(exception_fingerprint(exc_info))
+
 class JSONFormatter(logging.Formatter):
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None,
+                 exception_cache_size: int = 256,
+                 exception_dedupe_window: Optional[float] = None,
+                 exception_dedupe_size: int = 1024):
+        super().__init__(fmt, datefmt)
+        self.exception_cache_size = exception_cache_size
+        self.exception_dedupe_window = exception_dedupe_window
+        self.exception_dedupe_size = exception_dedupe_size
+        self._exception_cache: OrderedDict = OrderedDict()
+        self._exception_last_seen: OrderedDict = OrderedDict()
+        self._exception_lock = threading.Lock()
+
+    def _format_cached_exception(self, exc_info: Tuple) -> str:
+        key = _describe_exception(exc_info[0], exc_info[1], exc_info[2], True, set())
+        with self._exception_lock:
+            text = self._exception_cache.get(key)
+            if text is not None:
+                self._exception_cache.move_to_end(key)
+                return text
+        text = self.formatException(exc_info)
+        if self.exception_cache_size > 0:
+            with self._exception_lock:
+                self._exception_cache[key] = text
+                while len(self._exception_cache) > self.exception_cache_size:
+                    self._exception_cache.popitem(last=False)
+        return text
+
+    def _is_first_in_window(self, fingerprint_id: str, now: float) -> bool:
+        with self._exception_lock:
+            last_seen = self._exception_last_seen.get(fingerprint_id)
+            if last_seen is not None and now - last_seen < self.exception_dedupe_window:
+                return False
+            self._exception_last_seen[fingerprint_id] = now
+            self._exception_last_seen.move_to_end(fingerprint_id)
+            while len(self._exception_last_seen) > max(self.exception_dedupe_size, 1):
+                self._exception_last_seen.popitem(last=False)
+            return True
+
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
             "timestamp": self.formatTime(record),
@@ -99,7 +209,15 @@ class JSONFormatter(logging.Formatter):
                 log_record[key] = value
         
         if hasattr(record, "exc_info") and record.exc_info:
-            log_record["exception"] = self.formatException(record.exc_info)
+            if self.exception_dedupe_window is None:
+                log_record["exception"] = self._format_cached_exception(record.exc_info)
+            else:
+                fingerprint_id = _exception_fingerprint_id(record.exc_info)
+                log_record["exception_id"] = fingerprint_id
+                if self._is_first_in_window(fingerprint_id, record.created):
+                    log_record["exception"] = self._format_cached_exception(
+                        record.exc_info
+                    )
             
         return json.dumps(log_record, ensure_ascii=False)
 
@@ -127,7 +245,8 @@ def get_logger(
     batch_logging: bool = False,
     batch_size: int = 1000,
     batch_interval: float = 1.0,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    exception_dedupe_window: Optional[float] = None
 ) -> logging.Logger:
     global queue_listener
 
@@ -145,7 +264,7 @@ def get_logger(
 
     handlers = []
     
-    formatter = JSONFormatter() if structured else logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    formatter = JSONFormatter(exception_dedupe_window=exception_dedupe_window) if structured else logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     context_filter = ContextFilter()
     
     if color and not structured:
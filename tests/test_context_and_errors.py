@@ -2,7 +2,10 @@ import logging
 import pytest
 import json
 import os
-from scriptorium.logger import get_logger, close_logger, log_context, JSONFormatter
+import sys
+from scriptorium.logger import (
+    get_logger, close_logger, log_context, JSONFormatter, exception_fingerprint
+)
 from scriptorium.handlers import CompressionError
 
 @pytest.fixture
@@ -83,3 +86,188 @@ def test_context_cleanup(json_logger, caplog):
         json_logger.info("After error")
         log_record = get_json_from_record(caplog.records[0], json_logger)
         assert "test" not in log_record
+
+def _raise_value_error(message):
+    raise ValueError(message)
+
+def _exc_info_for(message):
+    try:
+        _raise_value_error(message)
+    except ValueError:
+        return sys.exc_info()
+
+def _make_record(exc_info, created=None):
+    record = logging.LogRecord("test_fp", logging.ERROR, __file__, 1,
+                               "Failure", None, exc_info)
+    if created is not None:
+        record.created = created
+    return record
+
+def test_exception_fingerprint_ignores_message():
+    assert (exception_fingerprint(_exc_info_for("first")) ==
+            exception_fingerprint(_exc_info_for("second")))
+    try:
+        raise KeyError("other")
+    except KeyError:
+        other = sys.exc_info()
+    assert exception_fingerprint(other) != exception_fingerprint(_exc_info_for("x"))
+
+def test_exception_text_cached(monkeypatch):
+    formatter = JSONFormatter()
+    calls = []
+    original = formatter.formatException
+    monkeypatch.setattr(formatter, "formatException",
+                        lambda ei: calls.append(ei) or original(ei))
+
+    for _ in range(5):
+        formatter.format(_make_record(_exc_info_for("Boom")))
+    log_record = json.loads(formatter.format(_make_record(_exc_info_for("Other"))))
+
+    assert len(calls) == 2
+    assert "ValueError: Other" in log_record["exception"]
+
+def test_exception_cache_bounded():
+    formatter = JSONFormatter(exception_cache_size=2)
+    for i in range(5):
+        formatter.format(_make_record(_exc_info_for(str(i))))
+    assert len(formatter._exception_cache) == 2
+
+def test_exception_dedupe_window():
+    formatter = JSONFormatter(exception_dedupe_window=10.0)
+    first = json.loads(formatter.format(_make_record(_exc_info_for("Boom"), 100.0)))
+    repeat = json.loads(formatter.format(_make_record(_exc_info_for("Boom"), 105.0)))
+    later = json.loads(formatter.format(_make_record(_exc_info_for("Boom"), 111.0)))
+
+    assert first["exception_id"] == repeat["exception_id"] == later["exception_id"]
+    assert "ValueError: Boom" in first["exception"]
+    assert "exception" not in repeat
+    assert "ValueError: Boom" in later["exception"]
+
+def _record_for(exc, created=None):
+    return _make_record((type(exc), exc, exc.__traceback__), created)
+
+def _raise_with_note(note):
+    try:
+        error = ValueError("same")
+        error.add_note(note)
+        raise error
+    except ValueError as error:
+        return error
+
+def _raise_group(sub_type):
+    try:
+        raise ExceptionGroup("g", [sub_type("inner")])
+    except ExceptionGroup as error:
+        return error
+
+def _raise_chained(explicit):
+    try:
+        try:
+            raise KeyError("inner")
+        except KeyError as inner:
+            error = ValueError("outer")
+            if explicit:
+                error.__cause__ = inner
+            raise error
+    except ValueError as error:
+        return error
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires add_note")
+def test_exception_cache_distinguishes_notes():
+    formatter = JSONFormatter()
+    first = json.loads(formatter.format(_record_for(_raise_with_note("note A"))))
+    second = json.loads(formatter.format(_record_for(_raise_with_note("note B"))))
+
+    assert "note A" in first["exception"]
+    assert "note B" in second["exception"]
+    assert "note A" not in second["exception"]
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires ExceptionGroup")
+def test_exception_cache_distinguishes_group_members():
+    formatter = JSONFormatter()
+    first = json.loads(formatter.format(_record_for(_raise_group(KeyError))))
+    second = json.loads(formatter.format(_record_for(_raise_group(TypeError))))
+
+    assert "KeyError" in first["exception"]
+    assert "TypeError" in second["exception"]
+    assert "KeyError" not in second["exception"]
+
+def test_exception_cache_distinguishes_cause_and_context():
+    formatter = JSONFormatter()
+    caused = json.loads(formatter.format(_record_for(_raise_chained(True))))
+    handled = json.loads(formatter.format(_record_for(_raise_chained(False))))
+
+    assert "direct cause" in caused["exception"]
+    assert "During handling" in handled["exception"]
+    assert "direct cause" not in handled["exception"]
+
+def test_exception_dedupe_skips_rendering_suppressed(monkeypatch):
+    formatter = JSONFormatter(exception_dedupe_window=60.0)
+    calls = []
+    original = formatter.formatException
+    monkeypatch.setattr(formatter, "formatException",
+                        lambda ei: calls.append(ei) or original(ei))
+
+    for i in range(10):
+        formatter.format(_make_record(_exc_info_for(f"attempt {i}"), 100.0 + i))
+
+    assert len(calls) == 1
+    assert len(formatter._exception_cache) == 1
+
+def test_get_logger_exception_dedupe_window():
+    logger = get_logger("test_dedupe", structured=True, exception_dedupe_window=30.0)
+    try:
+        formatters = [h.formatter for h in logger.handlers
+                      if isinstance(h.formatter, JSONFormatter)]
+        assert formatters
+        assert all(f.exception_dedupe_window == 30.0 for f in formatters)
+    finally:
+        close_logger(logger)
+
+def _add_lookups(a, b):
+    return a["x"] + b["x"]
+
+def _caret_lines(formatter, a, b):
+    try:
+        _add_lookups(a, b)
+    except TypeError:
+        record = _make_record(sys.exc_info())
+    text = json.loads(formatter.format(record))["exception"]
+    return [line for line in text.splitlines() if "^" in line]
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires caret markers")
+def test_exception_cache_distinguishes_sub_expressions():
+    formatter = JSONFormatter()
+    left = _caret_lines(formatter, None, {"x": 1})
+    right = _caret_lines(formatter, {"x": 1}, None)
+
+    assert left != right
+    assert right == _caret_lines(JSONFormatter(), {"x": 1}, None)
+
+def _raise_key_error():
+    raise KeyError("missing")
+
+def test_exception_dedupe_independent_of_cache_size():
+    formatter = JSONFormatter(exception_cache_size=0, exception_dedupe_window=60.0)
+    try:
+        _raise_key_error()
+    except KeyError:
+        key_error = sys.exc_info()
+    value_error = _exc_info_for("Boom")
+
+    emitted = []
+    for i in range(4):
+        for exc_info in (key_error, value_error):
+            record = json.loads(formatter.format(_make_record(exc_info, 100.0 + i)))
+            emitted.append("exception" in record)
+
+    assert emitted == [True, True] + [False] * 6
+
+def test_exception_dedupe_table_bounded():
+    formatter = JSONFormatter(exception_dedupe_window=60.0, exception_dedupe_size=1)
+    formatter.format(_make_record(_exc_info_for("Boom"), 100.0))
+    try:
+        _raise_key_error()
+    except KeyError:
+        formatter.format(_make_record(sys.exc_info(), 100.0))
+    assert len(formatter._exception_last_seen) == 1